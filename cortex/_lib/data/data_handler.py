@@ -40,6 +40,13 @@ class DataHandler:
         if len(dataset_entrypoint._datasets) == 0:
             raise ValueError('No datasets found in entrypoint')
 
+        # Pinned memory lets batches be copied to the GPU asynchronously.
+        # Custom loader classes may not support the argument.
+        loader_args = {}
+        if (DataLoader is torch.utils.data.DataLoader and
+                torch.device(exp.DEVICE).type == 'cuda'):
+            loader_args['pin_memory'] = True
+
         loaders = {}
         for k, dataset in dataset_entrypoint._datasets.items():
             N = len(dataset)
@@ -61,7 +68,8 @@ class DataHandler:
                                     shuffle=shuffle, num_workers=n_workers,
                                     worker_init_fn=lambda x:
                                     signal.signal(signal.SIGINT,
-                                                  signal.SIG_IGN))
+                                                  signal.SIG_IGN),
+                                    **loader_args)
 
         self.dims[source] = dataset_entrypoint._dims
         self.input_names[source] = dataset_entrypoint._input_names
@@ -99,7 +107,7 @@ class DataHandler:
                 if self.skip_last_batch:
                     raise StopIteration
                 batch_size = data[0].size()[0]
-            data = dict((k, v) for k, v in zip(self.input_names[source], data))
+            data = dict(zip(self.input_names[source], data))
             if len(sources) > 1:
                 output[source] = data
             else:
@@ -186,11 +194,9 @@ class DataHandler:
 
         def iterator():
             for inputs in loader:
-                inputs = [inp.to(exp.DEVICE) for inp in inputs]
-                inputs_ = []
-                for i, inp in enumerate(inputs):
-                    inputs_.append(inp)
-                yield inputs_
+                # Copies from pinned memory do not block the host.
+                yield [inp.to(exp.DEVICE, non_blocking=True)
+                       for inp in inputs]
         return iterator()
 
     def update_pbar(self):
@@ -32,6 +32,10 @@ class Handler(MutableMapping):
                      if not k.startswith('_'))
             raise KeyError(self._get_error_string.format(key, tuple(d.keys())))
 
+    def __contains__(self, key):
+        # Avoids the KeyError (and error string) from `__getitem__` on misses.
+        return key in self.__dict__
+
     def __delitem__(self, key):
         del self.__dict__[key]
 
@@ -60,14 +64,16 @@ class Handler(MutableMapping):
         super().__setattr__(key, value)
 
     def __iter__(self):
-        d = dict((k, v) for k, v in self.__dict__.items()
-                 if not k.startswith('_'))
-        return iter(d)
+        return iter([k for k in self.__dict__ if not k.startswith('_')])
 
     def __len__(self):
-        d = dict((k, v) for k, v in self.__dict__.items()
-                 if not k.startswith('_'))
-        return len(d)
+        return sum(1 for k in self.__dict__ if not k.startswith('_'))
+
+    def clear(self):
+        # `MutableMapping.clear` pops one item at a time, which rebuilds the
+        # key list for every item.
+        for k in list(self):
+            del self.__dict__[k]
 
     def lock(self):
         self._locked = True
@@ -90,6 +96,7 @@ def convert_nested_dict_to_handler(d, _class=Handler):
 class AliasedHandler(Handler):
     def __init__(self, handler, aliases=None):
         self._aliases = aliases or {}
+        self._r_aliases = dict((v, k) for k, v in self._aliases.items())
         self._handler = handler
 
     def __getattr__(self, item):
@@ -105,7 +112,7 @@ class AliasedHandler(Handler):
         if key.startswith('_'):
             return super().__setattr__(key, value)
 
-        if key in self._aliases.values():
+        if key in self._r_aliases:
             raise KeyError('Name clash. Key is a value in the set of aliases.')
 
         key = self._aliases.get(key, key)
@@ -117,18 +124,24 @@ class AliasedHandler(Handler):
         item = self._aliases.get(item, item)
         return self._handler.__getitem__(item)
 
+    def __contains__(self, item):
+        if item.startswith('_'):
+            return super().__contains__(item)
+        item = self._aliases.get(item, item)
+        return item in self._handler
+
     def __setitem__(self, key, value):
         if key.startswith('_'):
             return super().__setitem__(key, value)
 
-        if key in self._aliases.values():
+        if key in self._r_aliases:
             raise KeyError('Name clash. Key is a value in the set of aliases.')
 
         key = self._aliases.get(key, key)
         return self._handler.__setitem__(key, value)
 
     def __str__(self):
-        r_aliases = dict((v, k) for k, v in self._aliases.items())
+        r_aliases = self._r_aliases
         d = dict((r_aliases.get(k, k), v)
                  for k, v in self._handler.__dict__.items()
                  if not k.startswith('_'))
@@ -138,7 +151,7 @@ class AliasedHandler(Handler):
         return len(self._handler)
 
     def __iter__(self):
-        r_aliases = dict((v, k) for k, v in self._aliases.items())
+        r_aliases = self._r_aliases
         for k in self._handler:
             yield r_aliases.get(k, k)
 
@@ -146,6 +159,9 @@ class AliasedHandler(Handler):
         key = self._aliases.get(key, key)
         self._handler.__delattr__(key)
 
+    def clear(self):
+        self._handler.clear()
+
 
 def aliased(handler, aliases=None):
     return AliasedHandler(handler, aliases=aliases)
@@ -154,55 +170,67 @@ def aliased(handler, aliases=None):
 class PrefixedAliasedHandler(Handler):
     def __init__(self, handler, prefix=None):
         self._prefix = prefix or ''
+        # Joined once, as it's prepended on every access.
+        self._key_prefix = self._prefix + '_'
         self._handler = handler
 
     def __getattr__(self, item):
         if item.startswith('_'):
             return super().__setattr__(item)
-        item = self._prefix + '_' + item
+        item = self._key_prefix + item
         return self._handler.__getitem__(item)
 
     def __setattr__(self, key, value):
         if key.startswith('_'):
             return super().__setattr__(key, value)
 
-        key = self._prefix + '_' + key
+        key = self._key_prefix + key
         return self._handler.__setattr__(key, value)
 
     def __getitem__(self, item):
         if item.startswith('_'):
             return super().__getitem__(item)
-        item = self._prefix + '_' + item
+        item = self._key_prefix + item
         return self._handler.__getitem__(item)
 
+    def __contains__(self, item):
+        if item.startswith('_'):
+            return super().__contains__(item)
+        item = self._key_prefix + item
+        return item in self._handler
+
     def __setitem__(self, key, value):
         if key.startswith('_'):
             return super().__setitem__(key, value)
 
-        key = self._prefix + '_' + key
+        key = self._key_prefix + key
         return self._handler.__setitem__(key, value)
 
     def __str__(self):
-        d = dict((k[len(self._prefix) + 1:], v)
+        d = dict((k[len(self._key_prefix):], v)
                  for k, v in self._handler.__dict__.items()
-                 if not k.startswith('_') and k.startswith(self._prefix + '_'))
+                 if not k.startswith('_') and k.startswith(self._key_prefix))
         return d.__str__()
 
     def __len__(self):
-        d = dict((k[len(self._prefix) + 1:], v)
+        d = dict((k[len(self._key_prefix):], v)
                  for k, v in self._handler.__dict__.items()
-                 if not k.startswith('_') and k.startswith(self._prefix + '_'))
+                 if not k.startswith('_') and k.startswith(self._key_prefix))
         return len(d)
 
     def __iter__(self):
         for item in self._handler:
-            if item.startswith(self._prefix + '_'):
-                yield item[len(self._prefix) + 1:]
+            if item.startswith(self._key_prefix):
+                yield item[len(self._key_prefix):]
 
     def __delitem__(self, key):
-        key = self._prefix + '_' + key
+        key = self._key_prefix + key
         self._handler.__delattr__(key)
 
+    def clear(self):
+        for k in list(self):
+            del self[k]
+
 
 def prefixed(handler, prefix=None):
     return PrefixedAliasedHandler(handler, prefix=prefix)
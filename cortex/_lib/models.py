@@ -6,11 +6,13 @@ import copy
 import logging
 import time
 
+import torch
+
 from . import data, exp, optimizer
 from .parsing import parse_docstring, parse_inputs, parse_kwargs
 from .handlers import (aliased, prefixed, NetworkHandler, LossHandler,
                        ResultsHandler)
-from .utils import bad_values, update_dict_of_lists
+from .utils import bad_values, to_scalars, update_dict_of_lists
 from .viz import VizHandler
 
 
@@ -216,11 +218,8 @@ class ModelPluginBase(metaclass=PluginType):
         else:
             input_dict = {}
 
-        inputs = []
-        for k in keys:
-            key = input_dict.get(k, k)
-            inp = self.data[key]
-            inputs.append(inp)
+        data = self.data
+        inputs = [data[input_dict.get(k, k)] for k in keys]
 
         if len(inputs) == 0:
             return None
@@ -367,42 +366,36 @@ class ModelPluginBase(metaclass=PluginType):
 
         '''
 
-        def _fetch_kwargs(**kwargs_):
-            if self._contract is not None:
-                kwarg_dict = self._contract['kwargs']
-            else:
-                kwarg_dict = {}
-            kwarg_keys = parse_kwargs(fn).keys()
+        # The signature of `fn` and the contract don't change, so resolve
+        # the keyword and input names only once.
+        if self._contract is not None:
+            kwarg_dict = self._contract['kwargs']
+            input_dict = self._contract['inputs']
+        else:
+            kwarg_dict = {}
+            input_dict = {}
+        kwarg_keys = tuple((k, kwarg_dict.get(k, k))
+                           for k in parse_kwargs(fn).keys())
+        input_keys = tuple(input_dict.get(k, k) for k in parse_inputs(fn))
+        input_keys = tuple(k for k in input_keys if k != 'args')
 
+        def _fetch_kwargs(kwargs_):
+            model_kwargs = self.kwargs
             kwargs = dict()
-            for k in kwarg_keys:
-                key = kwarg_dict.get(k, k)
-                try:
-                    value = self.kwargs[key]
-                except KeyError:
-                    value = kwargs_.get(key)
-                kwargs[k] = value
+            for k, key in kwarg_keys:
+                if key in model_kwargs:
+                    kwargs[k] = model_kwargs[key]
+                else:
+                    kwargs[k] = kwargs_.get(key)
 
             return kwargs
 
         def _fetch_inputs():
-            if self._contract is not None:
-                input_dict = self._contract['inputs']
-            else:
-                input_dict = {}
-            input_keys = parse_inputs(fn)
-
-            inputs = []
-            for k in input_keys:
-                key = input_dict.get(k, k)
-                if key == 'args':
-                    continue
-                value = self.data[key]
-                inputs.append(value)
-            return inputs
+            data = self.data
+            return [data[key] for key in input_keys]
 
         def wrapped(*args, auto_input=False, **kwargs_):
-            kwargs = _fetch_kwargs(**kwargs_)
+            kwargs = _fetch_kwargs(kwargs_)
             for k, v in kwargs_.items():
                 if isinstance(v, dict) and (k in kwargs and
                                             isinstance(kwargs[k], dict)):
@@ -426,63 +419,79 @@ class ModelPluginBase(metaclass=PluginType):
 
         fn = self.routine
         fn = self._wrap(fn)
+        fid = self._get_id(fn)
 
         def wrapped(*args, **kwargs):
-            fid = self._get_id(fn)
-
-            if fid not in self._training_nets:
-                losses_before = dict(kv for kv in self._all_losses.items())
-                fn(*args, **kwargs)
-                losses_after = dict(kv for kv in self._all_losses.items())
-
-                training_nets = []
-
-                for k, v in losses_after.items():
-                    try:
-                        if k not in losses_before:
-                            training_nets.append(k)
-                        elif v != losses_before[k]:
-                            training_nets.append(k)
-                    except TypeError:
-                        training_nets.append(k)
-                self._training_nets[fid] = training_nets
-                for k in training_nets:
-                    self.losses.pop(k)
-            else:
-                training_nets = self._training_nets[fid]
+            training_nets = self._training_nets.get(fid)
+            if training_nets is None:
+                training_nets = self._find_training_nets(fid, fn, *args,
+                                                         **kwargs)
 
             if self._train:
+                nets = self.nets
+                optimizers = self._optimizers
+
                 for k in training_nets:
-                    net = self.nets[k]
+                    net = nets[k]
 
-                    optimizer = self._optimizers.get(k)
+                    optimizer = optimizers.get(k)
                     if optimizer is not None:
                         optimizer.zero_grad()
 
-                    for p in net.parameters():
-                        p.requires_grad = k in training_nets
+                    net.requires_grad_(True)
                     net.train()
 
-            start = time.time()
+            start = time.perf_counter()
             output = fn(*args, **kwargs)
-            self._check_bad_values()
-            end = time.time()
-
-            update_dict_of_lists(self._epoch_results, **self.results)
-            update_dict_of_lists(self._epoch_times,
-                                 **{self.name: end - start})
-            losses = dict()
-            for k, v in self.losses.items():
-                if isinstance(v, (tuple, list)):
-                    losses[k] = sum([v_.item() for v_ in v])
-                else:
-                    losses[k] = v.item()
+            results = dict(self.results)
+            losses = to_scalars(self.losses)
+            self._check_bad_values(results=results, losses=losses)
+            end = time.perf_counter()
+
+            update_dict_of_lists(self._epoch_results, **results)
+            self._epoch_times.setdefault(self.name, []).append(end - start)
             update_dict_of_lists(self._epoch_losses, **losses)
 
             return output
 
         self.routine = wrapped
 
+    def _find_training_nets(self, fid, fn, *args, **kwargs):
+        '''Finds the networks trained by a routine.
+
+        The routine is run once and any network whose loss is set is
+        considered trained by it. The result is stored for later calls.
+
+        Args:
+            fid: Identifier of the routine.
+            fn: Wrapped routine.
+            *args: Inputs to the routine.
+            **kwargs: Hyperparameters for the routine.
+
+        Returns:
+            List of network keys.
+
+        '''
+        losses_before = dict(kv for kv in self._all_losses.items())
+        fn(*args, **kwargs)
+        losses_after = dict(kv for kv in self._all_losses.items())
+
+        training_nets = []
+
+        for k, v in losses_after.items():
+            try:
+                if k not in losses_before:
+                    training_nets.append(k)
+                elif v != losses_before[k]:
+                    training_nets.append(k)
+            except TypeError:
+                training_nets.append(k)
+        self._training_nets[fid] = training_nets
+        for k in training_nets:
+            self.losses.pop(k)
+
+        return training_nets
+
     def _wrap_step(self, fn, train=True):
         '''Wraps the training or evaluation step.
 
@@ -507,7 +516,9 @@ class ModelPluginBase(metaclass=PluginType):
                 for net in self.nets.values():
                     net.eval()
 
-            output = fn(*args, **kwargs)
+            # Evaluation steps don't need the autograd graph.
+            with torch.set_grad_enabled(train):
+                output = fn(*args, **kwargs)
             self.losses.clear()
 
             return output
@@ -556,25 +567,34 @@ class ModelPluginBase(metaclass=PluginType):
 
         return training_nets
 
-    def _check_bad_values(self):
+    def _check_bad_values(self, results=None, losses=None):
         '''Check for bad numbers.
 
         This checks the results and the losses for nan or inf.
 
+        Args:
+            results: Result values to check. Defaults to the model results.
+            losses: Loss values to check, if already copied from the device.
+                Defaults to the model losses.
+
         '''
+        if results is None:
+            results = self.results
+        if losses is None:
+            losses = self.losses
 
-        bads = bad_values(self.results)
+        bads = bad_values(results)
         if bads:
             print(
                 'Bad values found (quitting): {} \n All:{}'.format(
-                    bads, self.results))
+                    bads, results))
             exit(0)
 
-        bads = bad_values(self.losses)
+        bads = bad_values(losses)
         if bads:
             print(
                 'Bad values found (quitting): {} \n All:{}'.format(
-                    bads, self.losses))
+                    bads, losses))
             exit(0)
 
     def reload_nets(self, nets_to_reload):
@@ -5,6 +5,7 @@
 import argparse
 import ast
 import copy
+import functools
 import inspect
 import logging
 import re
@@ -50,26 +51,38 @@ def parse_inputs(f):
     return args
 
 
-def parse_docstring(f):
-    if f.__doc__ is None:
-        f.__doc__ = 'TODO\n TODO'
-    doc = inspect.cleandoc(f.__doc__)
+@functools.lru_cache(maxsize=None)
+def _docstring_to_rst(doc):
+    '''Converts a google-style docstring to rst.
+
+    Cached on the docstring, as napoleon parsing dominates plugin import time.
+
+    '''
+    doc = inspect.cleandoc(doc)
     config = Config()
     google_doc = GoogleDocstring(doc, config)
-    rst = str(google_doc)
+    return str(google_doc)
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_params(doc):
+    rst = _docstring_to_rst(doc)
     param_regex = r':param (?P<param>\w+): (?P<doc>.*)'
     m = re.findall(param_regex, rst)
-    args_help = dict((k, v) for k, v in m)
+    return tuple(m)
+
+
+def parse_docstring(f):
+    if f.__doc__ is None:
+        f.__doc__ = 'TODO\n TODO'
+    args_help = dict((k, v) for k, v in _parse_params(f.__doc__))
     return args_help
 
 
 def parse_header(f):
     if f.__doc__ is None:
         f.__doc__ = 'TODO\n TODO'
-    doc = inspect.cleandoc(f.__doc__)
-    config = Config()
-    google_doc = GoogleDocstring(doc, config)
-    rst = str(google_doc)
+    rst = _docstring_to_rst(f.__doc__)
     lines = [l for l in rst.splitlines() if len(l) > 0]
     if len(lines) >= 2:
         return lines[:2]
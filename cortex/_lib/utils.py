@@ -39,37 +39,91 @@ def update_dict_of_lists(d_to_update, **d):
     '''
     for k, v in d.items():
         if isinstance(v, dict):
-            if k not in d_to_update.keys():
+            if k not in d_to_update:
                 d_to_update[k] = {}
             update_dict_of_lists(d_to_update[k], **v)
-        elif k in d_to_update.keys():
+        elif k in d_to_update:
             d_to_update[k].append(v)
         else:
             d_to_update[k] = [v]
 
 
+def _to_host(tensors):
+    '''Copies tensors to the host with one transfer per device.
+
+    Args:
+        tensors (list): tensors of any shape, dtype or device.
+
+    Returns:
+        list: the flattened values of each tensor, as lists of numbers.
+
+    '''
+    by_device = {}
+    for i, t in enumerate(tensors):
+        by_device.setdefault(t.device, []).append(i)
+
+    values = [None] * len(tensors)
+    for idx in by_device.values():
+        flat = torch.cat([tensors[i].detach().reshape(-1) for i in idx])
+        flat = flat.cpu().tolist()
+        j = 0
+        for i in idx:
+            n = tensors[i].numel()
+            values[i] = flat[j:j + n]
+            j += n
+    return values
+
+
+def to_scalars(d):
+    '''Converts a dict of scalar tensors to floats.
+
+    Tensors are copied to the host together, so this synchronizes once per
+    device instead of once per entry. Lists or tuples of tensors are summed.
+
+    Args:
+        d (dict): dictionary of scalar tensors.
+
+    Returns:
+        dict: dictionary of floats.
+
+    '''
+    entries = []
+    tensors = []
+    for k, v in d.items():
+        if not isinstance(v, (list, tuple)):
+            v = [v]
+        entries.append((k, v))
+        tensors += [v_ for v_ in v if isinstance(v_, torch.Tensor)]
+
+    host_values = iter(_to_host(tensors))
+
+    scalars = {}
+    for k, v in entries:
+        total = 0
+        for v_ in v:
+            if isinstance(v_, torch.Tensor):
+                total += sum(next(host_values))
+            else:
+                total += v_
+        scalars[k] = float(total)
+
+    return scalars
+
+
 def bad_values(d):
     failed = {}
+    scalars = {}
     for k, v in d.items():
         if isinstance(v, dict):
             v_ = bad_values(v)
             if v_:
                 failed[k] = v_
         else:
-            if isinstance(v, (list, tuple)):
-                v_ = []
-                for v__ in v:
-                    if isinstance(v__, torch.Tensor):
-                        v_.append(v__.item())
-                    else:
-                        v_.append(v__)
-                v_ = np.array(v_).sum()
-            elif isinstance(v, torch.Tensor):
-                v_ = v.item()
-            else:
-                v_ = v
-            if np.isnan(v_) or np.isinf(v_):
-                failed[k] = v_
+            scalars[k] = v
+
+    for k, v in to_scalars(scalars).items():
+        if np.isnan(v) or np.isinf(v):
+            failed[k] = v
 
     if len(failed) == 0:
         return False
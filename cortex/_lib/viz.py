@@ -4,27 +4,22 @@ Visualization.
 import logging
 from os import path
 
-import imageio
 import numpy as np
 from PIL import Image, ImageDraw
-import visdom
 
 from . import data, exp
 from .utils import convert_to_numpy, compute_tsne
 from .viz_utils import tile_raster_images
-import matplotlib
 import subprocess
 from cortex._lib.config import _yes_no
 
-matplotlib.use('Agg')
-from matplotlib import pylab as plt  # noqa E402
-
 __author__ = 'R Devon Hjelm'
 __author_email__ = 'erroneus@gmail.com'
 
 logger = logging.getLogger('cortex.viz')
 config_font = None
 visualizer = None
+_plt = None
 _options = dict(use_tanh=False, quantized=False, img=None, label_names=None,
                 is_caption=False, is_attribute=False)
 
@@ -38,6 +33,8 @@ CHAR_MAP = dict((i, CHARS[i]) for i in range(len(CHARS)))
 
 def init(viz_config):
     global visualizer, config_font, viz_process
+    import visdom
+
     if viz_config is not None and ('server' in viz_config.keys() or
                                    'port' in viz_config.keys()):
         server = viz_config.get('server', None)
@@ -412,6 +409,8 @@ def save_scatter(points, out_file=None, labels=None, caption='', title='',
 
 
 def save_movie(images, num_x, num_y, out_file=None, movie_id=0):
+    import imageio
+
     if out_file is None:
         logger.warning('`out_file` not provided. Not saving.')
     else:
@@ -432,7 +431,21 @@ def save_movie(images, num_x, num_y, out_file=None, movie_id=0):
                      win='movie_{}'.format(movie_id))
 
 
+def _get_plt():
+    '''Selects the matplotlib backend and imports pyplot on first use.
+
+    '''
+    global _plt
+    if _plt is None:
+        import matplotlib
+        matplotlib.use('Agg')
+        from matplotlib import pylab as plt
+        _plt = plt
+    return _plt
+
+
 def save_hist(scores, out_file, hist_id=0):
+    plt = _get_plt()
     s = list(scores.values())
     bins = np.linspace(np.min(np.array(s)),
                        np.max(np.array(s)), 100)
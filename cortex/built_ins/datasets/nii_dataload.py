@@ -57,17 +57,18 @@ def make_dataset(dir, patterns=None):
 
     file_list = []
 
-    all_items = [os.path.join(dir, i) for i in os.listdir(dir)]
-    directories = [os.path.join(dir, d) for d in all_items if os.path.isdir(d)]
     if patterns is not None:
         for i, pattern in enumerate(patterns):
             files = [(f, i) for f in glob(os.path.join(dir, pattern))]
             file_list.append(files)
     else:
-        file_list = [[(os.path.join(p, f), i)
-                      for f in os.listdir(p)
-                      if os.path.isfile(os.path.join(p, f))]
-                     for i, p in enumerate(directories)]
+        # `scandir` entries cache their file type, which saves a `stat` call
+        # per entry compared to `listdir` followed by `isdir` / `isfile`.
+        with os.scandir(dir) as it:
+            directories = [d.path for d in it if d.is_dir()]
+        for i, p in enumerate(directories):
+            with os.scandir(p) as it:
+                file_list.append([(f.path, i) for f in it if f.is_file()])
 
     for i, target in enumerate(file_list):
         for item in target:
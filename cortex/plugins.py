@@ -271,13 +271,15 @@ class ModelPlugin(ModelPluginBase):
         This can be overridden to change the behavior of the optimizer.
 
         """
-        keys = self.losses.keys()
+        keys = list(self.losses.keys())
+        #  TODO(Devon): Is this a good idea?
+        aliases = self.nets._aliases
 
         for i, k in enumerate(keys):
             loss = self.losses.pop(k)
-            loss.backward(retain_graph=(i < len(keys)))
-            #  TODO(Devon): Is this a good idea?
-            key = self.nets._aliases.get(k, k)
+            # Only the last loss can free the graph.
+            loss.backward(retain_graph=(i < len(keys) - 1))
+            key = aliases.get(k, k)
 
             optimizer = self._optimizers.get(key)
             if optimizer is not None:
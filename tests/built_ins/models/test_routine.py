@@ -2,8 +2,10 @@
 
 '''
 
+import torch
 import torch.optim as optim
 
+from cortex.built_ins.networks.fully_connected import FullyConnectedNet
 from cortex.plugins import ModelPlugin
 
 
@@ -110,3 +112,155 @@ def test_routine_with_submodels_2(model_class_with_submodel_2, data_class):
     model.train_step()
     model.train_step()
     model.train_step()
+
+
+def test_routine_requires_grad(model_class, data_class):
+    ModelPlugin._reset_class()
+
+    data = data_class(11)
+    model = model_class(contract=dict(inputs=dict(A='test')))
+    model._data = data
+    model.kwargs.update(a=11, b=13)
+    model.build()
+
+    params = list(model.nets.net.parameters())
+    model._optimizers = dict(net=optim.SGD(params, lr=0.0001))
+
+    for p in params:
+        p.requires_grad = False
+
+    model.train_step()
+    assert all(p.requires_grad for p in params)
+
+    model.train_step()
+    assert all(p.requires_grad for p in params)
+
+
+def test_routine_trains_frozen_net(model_class, data_class):
+    ModelPlugin._reset_class()
+
+    class FreezingModel(ModelPlugin):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.submodel = model_class(
+                contract=dict(kwargs=dict(a='d'), nets=dict(net='net2'),
+                              inputs=dict(A='test')))
+
+        def build(self, d=11, c=13):
+            self.submodel.build()
+            self.nets.net = FullyConnectedNet(d, c)
+
+        def routine(self, B):
+            # Freezes the submodel's network, as a GAN generator step
+            # would freeze the discriminator.
+            self.nets.net2.requires_grad_(False)
+            self.losses.net = self.nets.net(B).sum()
+
+        def train_step(self):
+            self.data.next()
+            self.routine(self.inputs('B'))
+            self.optimizer_step()
+
+            self.submodel.routine(self.submodel.inputs('A'))
+            self.submodel.optimizer_step()
+
+    data = data_class(11)
+    model = FreezingModel(contract=dict(inputs=dict(B='test')))
+    model._data = data
+    model.submodel._data = data
+    model.build()
+
+    optimizers = dict(
+        net=optim.SGD(model.nets.net.parameters(), lr=0.1),
+        net2=optim.SGD(model.nets.net2.parameters(), lr=0.1))
+    model._optimizers = optimizers
+    model.submodel._optimizers = optimizers
+
+    for _ in range(3):
+        before = [p.clone() for p in model.nets.net2.parameters()]
+        model.train_step()
+        after = list(model.nets.net2.parameters())
+        assert any((p - p_).abs().sum() > 0 for p, p_ in zip(before, after))
+
+
+def test_routine_trains_frozen_layer(data_class):
+    ModelPlugin._reset_class()
+
+    class LayeredModel(ModelPlugin):
+        def build(self):
+            self.nets.enc = torch.nn.Sequential(torch.nn.Linear(11, 7),
+                                                torch.nn.Linear(7, 1))
+
+        def routine(self, A):
+            self.losses.enc = self.nets.enc(A).sum()
+
+    data = data_class(11)
+    model = LayeredModel(contract=dict(inputs=dict(A='test')))
+    model._data = data
+    model.build()
+
+    model._optimizers = dict(
+        enc=optim.SGD(model.nets.enc.parameters(), lr=0.1))
+
+    for _ in range(3):
+        before = model.nets.enc[1].weight.clone()
+        model.train_step()
+        assert (model.nets.enc[1].weight - before).abs().sum() > 0
+
+        # Freezing a later layer must not outlast the next routine call.
+        model.nets.enc[1].requires_grad_(False)
+
+
+def test_eval_step_no_grad(model_class, data_class):
+    ModelPlugin._reset_class()
+
+    class GradModel(model_class):
+        def routine(self, A):
+            super().routine(A)
+            self.results.grad = float(torch.is_grad_enabled())
+
+    data = data_class(11)
+    model = GradModel(contract=dict(inputs=dict(A='test')))
+    model._data = data
+    model.kwargs.update(a=11, b=13)
+    model.build()
+
+    params = list(model.nets.net.parameters())
+    model._optimizers = dict(net=optim.SGD(params, lr=0.0001))
+
+    model.eval_step()
+    model._reset_epoch()
+
+    model.eval_step()
+    assert model._all_epoch_results['GradModel_grad'] == [0.]
+
+    model.train_step()
+    assert model._all_epoch_results['GradModel_grad'] == [0., 1.]
+
+
+def test_optimizer_step_shared_graph(data_class):
+    ModelPlugin._reset_class()
+
+    class SharedModel(ModelPlugin):
+        def build(self):
+            self.nets.net = FullyConnectedNet(11, 7)
+            self.nets.net2 = FullyConnectedNet(7, 3)
+            self.nets.net3 = FullyConnectedNet(7, 3)
+            self.nets.net4 = FullyConnectedNet(7, 3)
+
+        def routine(self, A):
+            h = self.nets.net(A)
+            self.losses.net2 = self.nets.net2(h).sum()
+            self.losses.net3 = self.nets.net3(h).sum()
+            self.losses.net4 = self.nets.net4(h).sum()
+
+    model = SharedModel(contract=dict(inputs=dict(A='test')))
+    model._data = data_class(11)
+    model.build()
+    model._optimizers = dict(
+        (k, optim.SGD(net.parameters(), lr=0.0001))
+        for k, net in model.nets.items())
+
+    model.train_step()
+    model.train_step()
+    assert len(model._all_epoch_losses['net4']) == 2
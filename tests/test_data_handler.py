@@ -0,0 +1,46 @@
+'''Tests the data handler iterators.
+
+'''
+
+import torch
+from torch.utils.data import TensorDataset
+
+from cortex._lib.data.data_handler import DataHandler
+from cortex.plugins import DatasetPlugin
+
+
+class RangeData(DatasetPlugin):
+    sources = ['range']
+
+    def handle(self, source):
+        pass
+
+
+def make_handler(N=23, batch_size=5, skip_last_batch=False):
+    entrypoint = RangeData()
+    x = torch.arange(N, dtype=torch.float32).view(N, 1)
+    entrypoint.add_dataset('train', TensorDataset(x, torch.arange(N)))
+    entrypoint.set_input_names(['inputs', 'index'])
+
+    handler = DataHandler()
+    handler.set_batch_size(batch_size, skip_last_batch=skip_last_batch)
+    handler.add_dataset('range', entrypoint, n_workers=0, shuffle=False)
+    handler.reset('train', make_pbar=False)
+    return handler
+
+
+def test_iterator():
+    handler = make_handler()
+    batches = [batch['index'].tolist() for batch in handler]
+
+    assert [len(b) for b in batches] == [5, 5, 5, 5, 3]
+    assert sum(batches, []) == list(range(23))
+    assert handler['inputs'].view(-1).tolist() == [20., 21., 22.]
+
+
+def test_iterator_skip_last_batch():
+    handler = make_handler(skip_last_batch=True)
+    batches = [batch['index'].tolist() for batch in handler]
+
+    assert [len(b) for b in batches] == [5, 5, 5, 5]
+    assert sum(batches, []) == list(range(20))
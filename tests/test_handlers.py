@@ -125,3 +125,32 @@ def test_prefixed_handler():
         assert 0
     except AttributeError:
         pass
+
+
+def test_clear_handlers():
+    h = Handler()
+    ah = AliasedHandler(h, aliases=dict(a='A'))
+    ph = PrefixedAliasedHandler(h, prefix='test')
+
+    ah.a = 1
+    h.b = 2
+    ph.c = 3
+
+    ph.clear()
+    assert set(h.keys()) == set(['A', 'b'])
+
+    ah.clear()
+    assert len(h) == 0
+    assert not h._locked
+
+
+def test_handler_contains():
+    h = Handler()
+    ah = AliasedHandler(h, aliases=dict(a='A'))
+    ph = PrefixedAliasedHandler(h, prefix='test')
+
+    ah.a = 1
+    ph.b = 2
+
+    assert 'A' in h and 'a' in ah and 'b' in ph and 'test_b' in h
+    assert 'a' not in h and 'b' not in ah and 'c' not in ph
@@ -0,0 +1,52 @@
+'''Tests the utility methods.
+
+'''
+
+import pytest
+import torch
+
+from cortex._lib.utils import bad_values, to_scalars
+
+
+def test_to_scalars():
+    d = dict(a=torch.tensor(1.), b=[torch.tensor(2.), torch.tensor(3.)],
+             c=4)
+    scalars = to_scalars(d)
+
+    assert scalars == dict(a=1., b=5., c=4.)
+    assert list(scalars.keys()) == ['a', 'b', 'c']
+    assert to_scalars({}) == {}
+
+    x = 1. + 1e-12
+    assert to_scalars(dict(x=torch.tensor(x, dtype=torch.float64))) == \
+        dict(x=x)
+
+
+def test_bad_values():
+    d = dict(a=torch.tensor(1.), b=dict(c=float('nan'), d=2.),
+             e=[torch.tensor(1.), torch.tensor(float('inf'))])
+    bads = bad_values(d)
+
+    assert set(bads.keys()) == set(['b', 'e'])
+    assert list(bads['b'].keys()) == ['c']
+    assert not bad_values(dict(a=torch.tensor(1.), b=dict(c=2.)))
+
+
+def test_bad_values_mixed_shapes():
+    d = dict(a=torch.tensor(1.), b=torch.tensor([2.]),
+             c=torch.tensor(3., dtype=torch.float64))
+    assert not bad_values(d)
+
+    d['b'] = torch.tensor([float('nan')])
+    assert list(bad_values(d).keys()) == ['b']
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason='requires CUDA')
+def test_bad_values_mixed_devices():
+    d = dict(a=torch.tensor(1.), b=torch.tensor(2., device='cuda'),
+             c=[torch.tensor(1.), torch.tensor(1., device='cuda')])
+    assert not bad_values(d)
+    assert to_scalars(d) == dict(a=1., b=2., c=2.)
+
+    d['b'] = torch.tensor(float('inf'), device='cuda')
+    assert list(bad_values(d).keys()) == ['b']